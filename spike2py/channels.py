@@ -65,19 +65,29 @@ class Event(Channel):
     name
         Name of Event channel
     data_dict:
-        - ['path_save_figures']: Path - Directory where channel figure saved
-        - ['trial_name']: str - Name of trial where Event was recorded
-        - ['subject_id']: str - Identifier
         - ['times']: np.ndarray - Event times in seconds
+    path_save_figures
+        Directory where channel figure saved
+    trial_name
+        Name of trial where Event was recorded
+    subject_id
+        Identifier
     """
 
-    def __init__(self, name: str, data_dict: parsed_event) -> None:
+    def __init__(
+        self,
+        name: str,
+        data_dict: parsed_event,
+        path_save_figures: Path = None,
+        trial_name: str = None,
+        subject_id: str = None,
+    ) -> None:
         super().__init__(
             ChannelInfo(
                 name=name,
-                path_save_figures=data_dict["path_save_figures"],
-                trial_name=data_dict["trial_name"],
-                subject_id=data_dict["subject_id"],
+                path_save_figures=path_save_figures,
+                trial_name=trial_name,
+                subject_id=subject_id,
             ),
             data_dict["times"],
         )
@@ -107,21 +117,31 @@ class Keyboard(Channel):
     name
         Name of Keyboard channel; default is 'keyboard'
     data_dict:
-        - ['path_save_figures']: Path - Directory where channel figure saved
-        - ['trial_name']: str - Name of trial where Keyboard was recorded
-        - ['subject_id']: str - Identifier
         - ['times']: np.ndarray - Event times in seconds
         - ['codes']: np.ndarray of str associated with keyboard events
+    path_save_figures
+        Directory where channel figure saved
+    trial_name
+        Name of trial where Keyboard was recorded
+    subject_id
+        Identifier
     """
 
-    def __init__(self, name: str, data_dict: parsed_keyboard) -> None:
+    def __init__(
+        self,
+        name: str,
+        data_dict: parsed_keyboard,
+        path_save_figures: Path = None,
+        trial_name: str = None,
+        subject_id: str = None,
+    ) -> None:
         self.codes = data_dict["codes"]
         super().__init__(
             ChannelInfo(
                 name=name,
-                path_save_figures=data_dict["path_save_figures"],
-                trial_name=data_dict["trial_name"],
-                subject_id=data_dict["subject_id"],
+                path_save_figures=path_save_figures,
+                trial_name=trial_name,
+                subject_id=subject_id,
             ),
             data_dict["times"],
         )
@@ -152,26 +172,38 @@ class Waveform(Channel, sig_proc.SignalProcessing):
     name
         Name of Waveform channel
     data_dict:
-        - ['path_save_figures']: Path - Directory where channel figure saved
-        - ['trial_name']: str - Name of trial where Waveform was recorded
-        - ['subject_id']: str - Identifier
         - ['times']: np.ndarray - Waveform times in seconds
         - ['values']: np.ndarray - Waveform float values
         - ['units']: str - Measurement units (e.g. 'Volts')
         - ['sampling_frequency']: int - Sampling frequency of Wavemark
+    path_save_figures
+        Directory where channel figure saved
+    trial_name
+        Name of trial where Waveform was recorded
+    subject_id
+        Identifier
     """
 
-    def __init__(self, name: str, data_dict: parsed_waveform) -> None:
-        self.values = data_dict["values"]
-        self.raw_values = self.values
+    def __init__(
+        self,
+        name: str,
+        data_dict: parsed_waveform,
+        path_save_figures: Path = None,
+        trial_name: str = None,
+        subject_id: str = None,
+    ) -> None:
+        # Copy so the in-place processing kernels never write back into the
+        # caller's array; raw_values gets its own buffer for the same reason.
+        self.values = np.array(data_dict["values"])
+        self.raw_values = np.array(self.values)
         super().__init__(
             ChannelInfo(
                 name=name,
                 units=data_dict["units"],
                 sampling_frequency=data_dict["sampling_frequency"],
-                path_save_figures=data_dict["path_save_figures"],
-                trial_name=data_dict["trial_name"],
-                subject_id=data_dict["subject_id"],
+                path_save_figures=path_save_figures,
+                trial_name=trial_name,
+                subject_id=subject_id,
             ),
             data_dict["times"],
         )
@@ -201,25 +233,35 @@ class Wavemark(Channel):
     name
         Name of Wavemark channel
     data_dict:
-        - ['path_save_figures']: Path - Directory where channel figure saved
-        - ['trial_name']: str - Name of trial where Wavemark was recorded
-        - ['subject_id']: str - Identifier
         - ['times']: np.ndarray - Wavemark times in seconds
         - ['values']: np.ndarray - Waveform float values
         - ['action_potentials']: list of lists - Each list is a Wavemark
         - ['units']: str - Measurement units (e.g. 'Volts')
         - ['sampling_frequency']: int - Sampling frequency of Wavemark
+    path_save_figures
+        Directory where channel figure saved
+    trial_name
+        Name of trial where Wavemark was recorded
+    subject_id
+        Identifier
     """
 
-    def __init__(self, name: str, data_dict: parsed_wavemark) -> None:
+    def __init__(
+        self,
+        name: str,
+        data_dict: parsed_wavemark,
+        path_save_figures: Path = None,
+        trial_name: str = None,
+        subject_id: str = None,
+    ) -> None:
         super().__init__(
             ChannelInfo(
                 name=name,
                 units=data_dict["units"],
                 sampling_frequency=data_dict["sampling_frequency"],
-                path_save_figures=data_dict["path_save_figures"],
-                trial_name=data_dict["trial_name"],
-                subject_id=data_dict["subject_id"],
+                path_save_figures=path_save_figures,
+                trial_name=trial_name,
+                subject_id=subject_id,
             ),
             data_dict["times"],
         )
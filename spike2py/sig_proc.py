@@ -1,20 +1,161 @@
 from typing import List, Literal
 
 import numpy as np
-from scipy.signal import butter, filtfilt, detrend
+from numba import njit, prange, float32, float64, int64
+from scipy.signal import butter
 
 from spike2py.types import filt_cutoff_single, filt_cutoff_pair, filt_cutoff
 
 
+@njit(
+    [float64[:](float64[:], int64), float32[:](float32[:], int64)],
+    cache=True,
+    fastmath=True,
+    parallel=True,
+)
+def _remove_mean_kernel(values: np.ndarray, first_n: int) -> np.ndarray:
+    total = 0.0
+    for i in prange(first_n):
+        total += values[i]
+    mean = total / first_n
+    for i in prange(values.shape[0]):
+        values[i] -= mean
+    return values
+
+
+@njit(
+    [float64[:](float64[:], float64), float32[:](float32[:], float64)],
+    cache=True,
+    fastmath=True,
+    parallel=True,
+)
+def _remove_value_kernel(values: np.ndarray, value: float) -> np.ndarray:
+    for i in prange(values.shape[0]):
+        values[i] -= value
+    return values
+
+
+@njit(
+    [float64[:](float64[:], float64), float32[:](float32[:], float64)],
+    cache=True,
+    fastmath=True,
+    parallel=True,
+)
+def _norm_max_kernel(values: np.ndarray, target: float) -> np.ndarray:
+    peak = values[0]
+    for i in prange(values.shape[0]):
+        peak = max(peak, values[i])
+    factor = target / peak
+    for i in prange(values.shape[0]):
+        values[i] *= factor
+    return values
+
+
+@njit(
+    [float64[:](float64[:], float64), float32[:](float32[:], float64)],
+    cache=True,
+    fastmath=True,
+    parallel=True,
+)
+def _scale_kernel(values: np.ndarray, factor: float) -> np.ndarray:
+    for i in prange(values.shape[0]):
+        values[i] *= factor
+    return values
+
+
+@njit([float64[:](float64[:]), float32[:](float32[:])], cache=True, fastmath=True)
+def _linear_detrend_kernel(values: np.ndarray) -> np.ndarray:
+    n = values.shape[0]
+    mean_x = (n - 1) / 2.0
+    sum_y = 0.0
+    sum_xy = 0.0
+    for i in range(n):
+        sum_y += values[i]
+        sum_xy += (i - mean_x) * values[i]
+    slope = sum_xy / (n * (n * n - 1.0) / 12.0)
+    intercept = sum_y / n - slope * mean_x
+    for i in range(n):
+        values[i] -= intercept + slope * i
+    return values
+
+
+@njit(
+    [float64[:](float64[:]), float32[:](float32[:])],
+    cache=True,
+    fastmath=True,
+    parallel=True,
+)
+def _rect_kernel(values: np.ndarray) -> np.ndarray:
+    for i in prange(values.shape[0]):
+        values[i] = abs(values[i])
+    return values
+
+
+@njit(
+    [float64[:](float64[:, :], float64[:]), float32[:](float64[:, :], float32[:])],
+    cache=True,
+    fastmath=True,
+)
+def _sosfiltfilt(sos: np.ndarray, x: np.ndarray) -> np.ndarray:
+    n = x.shape[0]
+    # scipy's sosfiltfilt padlen rule: first-order sections shorten the
+    # effective impulse response, so they subtract from the tap count.
+    first_order_b = 0
+    first_order_a = 0
+    for s in range(sos.shape[0]):
+        if sos[s, 2] == 0.0:
+            first_order_b += 1
+        if sos[s, 5] == 0.0:
+            first_order_a += 1
+    padlen = 3 * (2 * sos.shape[0] + 1 - min(first_order_b, first_order_a))
+    if padlen > n - 1:
+        padlen = n - 1
+    ext = np.empty(n + 2 * padlen, dtype=x.dtype)
+    for i in range(padlen):
+        ext[i] = 2.0 * x[0] - x[padlen - i]
+        ext[padlen + n + i] = 2.0 * x[n - 1] - x[n - 2 - i]
+    ext[padlen : padlen + n] = x
+    m = ext.shape[0]
+    for s in range(sos.shape[0]):
+        b0, b1, b2 = sos[s, 0], sos[s, 1], sos[s, 2]
+        a1, a2 = sos[s, 4], sos[s, 5]
+        # Steady-state (lfilter_zi-style) initial conditions scaled by the
+        # first sample of the pass suppress the startup transient.
+        gain = (b0 + b1 + b2) / (1.0 + a1 + a2)
+        z1 = (b1 + b2 - (a1 + a2) * gain) * ext[0]
+        z2 = (b2 - a2 * gain) * ext[0]
+        for i in range(m):
+            v = ext[i]
+            out = b0 * v + z1
+            z1 = b1 * v - a1 * out + z2
+            z2 = b2 * v - a2 * out
+            ext[i] = out
+    for s in range(sos.shape[0]):
+        b0, b1, b2 = sos[s, 0], sos[s, 1], sos[s, 2]
+        a1, a2 = sos[s, 4], sos[s, 5]
+        gain = (b0 + b1 + b2) / (1.0 + a1 + a2)
+        z1 = (b1 + b2 - (a1 + a2) * gain) * ext[m - 1]
+        z2 = (b2 - a2 * gain) * ext[m - 1]
+        for i in range(m - 1, -1, -1):
+            v = ext[i]
+            out = b0 * v + z1
+            z1 = b1 * v - a1 * out + z2
+            z2 = b2 * v - a2 * out
+            ext[i] = out
+    return ext[padlen : padlen + n].copy()
+
+
 class SignalProcessing:
     """Mixin class that adds signal processing methods"""
 
     def _setattr(self, name: str):
-        setattr(self, name, self.values)
+        # Snapshot a copy: the kernels mutate `values` in place, and each
+        # proc_* attribute documents the waveform as it was at that step.
+        setattr(self, name, np.array(self.values))
 
     def remove_mean(self, first_n_samples: int = None):
         """Subtract mean of first n samples (default is all samples)"""
-        values_slice = slice(0, -1)
+        first_n = len(self.values) - 1
         if first_n_samples is not None:
             if (first_n_samples < 1) or (first_n_samples > len(self.values)):
                 raise ValueError(
@@ -23,20 +164,19 @@ class SignalProcessing:
                 )
             if not isinstance(first_n_samples, int):
                 raise TypeError("first_n_samples must be a whole number, an integer")
-            values_slice = slice(0, first_n_samples)
-        self.values -= np.mean(self.values[values_slice])
+            first_n = first_n_samples
+        self.values = _remove_mean_kernel(self.values, first_n)
         self._setattr("proc_remove_mean")
         return self
 
     def remove_value(self, value: float):
         """Subtracts value from `values` """
-        try:
-            self.values -= value
-            str_value = self._float_to_string_with_underscore(value)
-            self._setattr(f"proc_remove_value_{str_value}")
-            return self
-        except np.core._exceptions.UFuncTypeError:
+        if not isinstance(value, (int, float, np.integer, np.floating)):
             raise TypeError("`value` must be a whole number or a decimal number.")
+        self.values = _remove_value_kernel(self.values, value)
+        str_value = self._float_to_string_with_underscore(value)
+        self._setattr(f"proc_remove_value_{str_value}")
+        return self
 
     def _float_to_string_with_underscore(self, float_value: float):
         return str(abs(float_value)).replace(".", "_")
@@ -71,8 +211,11 @@ class SignalProcessing:
         self._check_valid_cutoff(cutoff_1d_array)
         self._check_valid_filter_order(order)
         critical_fq = cutoff_1d_array / (self.info.sampling_frequency / 2)
-        filt_coef_b, filt_coef_a = butter(order, critical_fq, filt_type)
-        self.values = filtfilt(filt_coef_b, filt_coef_a, self.values)
+        sos = butter(order, critical_fq, filt_type, output="sos")
+        values = np.asarray(self.values)
+        if values.dtype.kind != "f":
+            values = values.astype(float)
+        self.values = _sosfiltfilt(sos, values)
         self._setattr(
             f"proc_filt_{self._cutoff_to_string(cutoff_1d_array)}_{filt_type}"
         )
@@ -115,25 +258,25 @@ class SignalProcessing:
 
     def norm_percentage(self):
         """Normalise `values` to be between 0-100%"""
-        self.values = (self.values / np.max(self.values)) * 100
+        self.values = _norm_max_kernel(self.values, 100.0)
         self._setattr(f"proc_norm_percentage")
         return self
 
     def norm_proportion(self):
         """Normalise `values` to be between 0-1"""
-        self.values = self.values / np.max(self.values)
+        self.values = _norm_max_kernel(self.values, 1.0)
         self._setattr(f"proc_norm_proportion")
         return self
 
     def norm_percent_value(self, value: float):
         """Normalise `values` to a percentage of `value`"""
-        self.values = (self.values / value) * 100
+        self.values = _scale_kernel(self.values, 100.0 / value)
         self._setattr(f"proc_norm_value")
         return self
 
     def rect(self):
         """Rectify values"""
-        self.values = abs(self.values)
+        self.values = _rect_kernel(self.values)
         self._setattr("proc_rect")
         return self
 
@@ -176,6 +319,11 @@ class SignalProcessing:
 
     def linear_detrend(self):
         """Remove linear trend from `values`"""
-        self.values = detrend(self.values, type="linear")
+        # The kernel subtracts the trend in place, like the other kernels;
+        # raw_values and the proc_* snapshots hold their own copies.
+        values = np.asarray(self.values)
+        if values.dtype.kind != "f":
+            values = values.astype(float)
+        self.values = _linear_detrend_kernel(values)
         self._setattr("proc_linear_detrend")
         return self
@@ -87,13 +87,15 @@ class Trial:
         self._parse_trial_data()
 
     def __repr__(self) -> str:
-        channel_text = list()
-        for channel_name, channel_type in self.channels:
-            channel_text.append(f"\n\t\t{channel_name} ({channel_type})")
-        channel_info = "".join(channel_text)
+        channel_info = "".join(
+            f"\n\t\t{channel_name} ({channel_type})"
+            for channel_name, channel_type in self.channels
+        )
+        if not hasattr(self, "_file_uri"):
+            self._file_uri = Path(self.info.file).absolute().as_uri()
         return (
             f"\n{self.info.name}"
-            f"\n\tfile = {Path(self.info.file).absolute().as_uri()}"
+            f"\n\tfile = {self._file_uri}"
             f"\n\tsubject_id = {self.info.subject_id}"
             f"\n\tpath_save_figures = {self.info.path_save_figures}"
             f"\n\tpath_save_trial = {self.info.path_save_trial}"
@@ -101,15 +103,16 @@ class Trial:
         )
 
     def _add_defaults_to_trial_info(self, trial_info: TrialInfo):
-        name = trial_info.name if trial_info.name else Path(trial_info.file).stem
+        file = Path(trial_info.file)
+        name = trial_info.name if trial_info.name else file.stem
         subject_id = trial_info.subject_id if trial_info.subject_id else "sub"
         path_save_figures = _check_make_path(
             path_to_check=trial_info.path_save_figures,
-            path_to_make=Path(trial_info.file).parent / "figures",
+            path_to_make=file.parent / "figures",
         )
         path_save_trial = _check_make_path(
             path_to_check=trial_info.path_save_trial,
-            path_to_make=Path(trial_info.file).parent / "data",
+            path_to_make=file.parent / "data",
         )
         self.info = TrialInfo(
             file=trial_info.file,
@@ -122,16 +125,21 @@ class Trial:
 
     def _parse_trial_data(self):
         trial_data = self._import_trial_data()
-        channel_names = list()
-        for key, value in trial_data.items():
-            channel_names.append((key.title(), value["ch_type"]))
-            value["path_save_figures"] = self.info.path_save_figures
-            value["trial_name"] = self.info.name
-            value["subject_id"] = self.info.subject_id
+        channel_names = [None] * len(trial_data)
+        for index, (key, value) in enumerate(trial_data.items()):
+            channel_name = key.title()
+            channel_type = value["ch_type"]
+            channel_names[index] = (channel_name, channel_type)
             setattr(
                 self,
-                key.title(),
-                CHANNEL_GENERATOR[value["ch_type"]](key, value),
+                channel_name,
+                CHANNEL_GENERATOR[channel_type](
+                    key,
+                    value,
+                    path_save_figures=self.info.path_save_figures,
+                    trial_name=self.info.name,
+                    subject_id=self.info.subject_id,
+                ),
             )
         self.channels = channel_names
 
@@ -159,8 +167,7 @@ def _check_make_path(path_to_check: Path, path_to_make: Path):
         path_to_check = Path(path_to_check)
     else:
         path_to_check = path_to_make
-    if not path_to_check.exists():
-        path_to_check.mkdir(parents=True)
+    path_to_check.mkdir(parents=True, exist_ok=True)
     return path_to_check
 
 
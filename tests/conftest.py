@@ -1,16 +1,15 @@
 import os
 from pathlib import Path
-import random
 
 import pytest
 import numpy as np
 import scipy.io as sio
+from scipy.signal import welch
 import matplotlib.pyplot as plt
 
 from spike2py import channels, sig_proc
 
 
-ACTION_POTENTIALS = [[random.random() for i in range(62)] for _ in range(3)]
 PAYLOADS_DIR = Path(__file__).parent / "payloads"
 PATH = Path(".")
 EVENT = {
@@ -18,10 +17,10 @@ EVENT = {
     "data_dict": {
         "times": np.array([7.654, 7.882]),
         "ch_type": "event",
-        "path_save_figures": Path("."),
-        "trial_name": "strong_you_are",
-        "subject_id": "Yoda",
     },
+    "path_save_figures": Path("."),
+    "trial_name": "strong_you_are",
+    "subject_id": "Yoda",
 }
 KEYBOARD = {
     "name": "keyboard",
@@ -29,10 +28,10 @@ KEYBOARD = {
         "codes": ["t", "a", "5"],
         "times": np.array([1.34, 100.334]),
         "ch_type": "keyboard",
-        "path_save_figures": Path("."),
-        "trial_name": "strong_you_are",
-        "subject_id": "Yoda",
     },
+    "path_save_figures": Path("."),
+    "trial_name": "strong_you_are",
+    "subject_id": "Yoda",
 }
 WAVEFORM = {
     "name": "biceps",
@@ -42,10 +41,10 @@ WAVEFORM = {
         "values": np.array([32, 23, 65, 67, 46, 91, 29, 44]) / 1000,
         "sampling_frequency": 2048,
         "ch_type": "waveform",
-        "path_save_figures": Path("."),
-        "trial_name": "strong_you_are",
-        "subject_id": "Yoda",
     },
+    "path_save_figures": Path("."),
+    "trial_name": "strong_you_are",
+    "subject_id": "Yoda",
 }
 WAVEMARK = {
     "name": "MG",
@@ -53,12 +52,11 @@ WAVEMARK = {
         "units": "Volts",
         "times": np.array([7.432, 7.765, 7.915]),
         "sampling_frequency": 10240,
-        "action_potentials": ACTION_POTENTIALS,
         "ch_type": "wavemark",
-        "path_save_figures": Path("."),
-        "trial_name": "strong_you_are",
-        "subject_id": "Yoda",
     },
+    "path_save_figures": Path("."),
+    "trial_name": "strong_you_are",
+    "subject_id": "Yoda",
 }
 
 
@@ -69,19 +67,23 @@ PATH_TO_MAT_FILES = [
 ]
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def payload_dir():
     return PAYLOADS_DIR
 
 
-@pytest.fixture()
-def data_setup():
+@pytest.fixture(scope="session")
+def mat_datasets():
     files = {
         "physiology": PATH_TO_MAT_FILES[0],
         "biomech": PATH_TO_MAT_FILES[1],
         "motor_unit": PATH_TO_MAT_FILES[2],
     }
-    mat_datasets = {key: sio.loadmat(value) for key, value in files.items()}
+    return {key: sio.loadmat(value) for key, value in files.items()}
+
+
+@pytest.fixture()
+def data_setup(mat_datasets):
     return {
         "mat_datasets": mat_datasets,
         "mat_waveform": mat_datasets["biomech"]["k_angle"],
@@ -92,18 +94,30 @@ def data_setup():
     }
 
 
+@pytest.fixture(scope="session")
+def action_potentials():
+    return np.random.default_rng(0).random((3, 62))
+
+
 @pytest.fixture()
-def channels_init():
+def channels_init(action_potentials):
+    wavemark = {
+        **WAVEMARK,
+        "data_dict": {
+            **WAVEMARK["data_dict"],
+            "action_potentials": action_potentials,
+        },
+    }
     return {
         "event": EVENT,
         "keyboard": KEYBOARD,
         "waveform": WAVEFORM,
-        "wavemark": WAVEMARK,
+        "wavemark": wavemark,
     }
 
 
 @pytest.fixture()
-def channels_mock():
+def channels_mock(action_potentials):
     event = {
         "info": channels.ChannelInfo(
             name="stimulator",
@@ -151,7 +165,7 @@ def channels_mock():
             subject_id="Yoda",
         ),
         "times": np.array([7.432, 7.765, 7.915]),
-        "action_potentials": ACTION_POTENTIALS,
+        "action_potentials": action_potentials,
         "ch_type": "wavemark",
         "instantaneous_firing_frequency": np.array([3.003003, 6.6666667]),
         "__repr__": "Wavemark channel",
@@ -164,7 +178,7 @@ def channels_mock():
     }
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def mixin_methods():
     return [
         "_setattr",
@@ -192,13 +206,17 @@ def mixin_methods():
     ]
 
 
+_mixin_base_arrays = None
+
+
 def _generate_mixin_values():
-    random.seed(42)
-    line = np.linspace(0, 5, 10000)
-    noise = np.array([random.random() for _ in range(10000)])
-    values = line + noise
-    times = np.linspace(0, 100, 10000)
-    return values, times
+    global _mixin_base_arrays
+    if _mixin_base_arrays is None:
+        line = np.linspace(0, 5, 10000)
+        noise = np.random.default_rng(42).random(10000)
+        _mixin_base_arrays = (line + noise, np.linspace(0, 100, 10000))
+    values, times = _mixin_base_arrays
+    return values.copy(), times.copy()
 
 
 @pytest.fixture()
@@ -211,6 +229,19 @@ def mixin():
     return mixin
 
 
+@pytest.fixture(scope="session")
+def welch_psd():
+    def _welch_psd(mixin):
+        return welch(
+            x=mixin.values,
+            fs=mixin.info.sampling_frequency,
+            nperseg=1024,
+            detrend="linear",
+        )
+
+    return _welch_psd
+
+
 @pytest.fixture()
 def negative_value_mixin():
     mixin = sig_proc.SignalProcessing()
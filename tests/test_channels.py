@@ -1,3 +1,4 @@
+import numpy as np
 from pytest import approx
 
 from spike2py import channels
@@ -50,6 +51,34 @@ def test_channels_waveform_init(channels_init, channels_mock):
     assert repr(waveform) == "Waveform channel"
 
 
+def test_channels_waveform_rect_preserves_snapshots(channels_init, channels_mock):
+    waveform = channels.Waveform(**channels_init["waveform"])
+    waveform.remove_mean().lowpass(cutoff=5).rect()
+    assert np.array_equal(
+        waveform.raw_values, channels_mock["waveform"]["values"]
+    )
+    assert min(waveform.proc_filt_5_lowpass) < 0
+    assert min(waveform.values) >= 0
+
+
+def test_channels_waveform_norm_preserves_raw_values(channels_init, channels_mock):
+    waveform = channels.Waveform(**channels_init["waveform"])
+    waveform.norm_percentage()
+    assert np.array_equal(
+        waveform.raw_values, channels_mock["waveform"]["values"]
+    )
+    assert max(waveform.values) == approx(100.0)
+
+
+def test_channels_waveform_detrend_preserves_raw_values(channels_init, channels_mock):
+    waveform = channels.Waveform(**channels_init["waveform"])
+    waveform.linear_detrend()
+    assert np.array_equal(
+        waveform.raw_values, channels_mock["waveform"]["values"]
+    )
+    assert np.mean(waveform.values) == approx(0.0)
+
+
 def test_channels_wavemark_init(channels_init, channels_mock):
     wavemark = channels.Wavemark(**channels_init["wavemark"])
     assert wavemark.info.name == channels_mock["wavemark"]["info"].name
@@ -65,7 +94,9 @@ def test_channels_wavemark_init(channels_init, channels_mock):
         wavemark.info.sampling_frequency
         == channels_mock["wavemark"]["info"].sampling_frequency
     )
-    assert wavemark.action_potentials == channels_mock["wavemark"]["action_potentials"]
+    assert np.array_equal(
+        wavemark.action_potentials, channels_mock["wavemark"]["action_potentials"]
+    )
     actual_inst_fq = wavemark.inst_firing_frequency
     assert actual_inst_fq == approx(
         channels_mock["wavemark"]["instantaneous_firing_frequency"]
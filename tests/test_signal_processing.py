@@ -1,7 +1,7 @@
 import pytest
 from pytest import approx
 import numpy as np
-from scipy.signal import welch
+from scipy.signal import butter, sosfiltfilt
 
 from spike2py import sig_proc
 
@@ -15,13 +15,13 @@ def test_signal_processing_methods_present(mixin_methods):
 def test_signal_processing_remove_mean_all_values(mixin):
     mixin.remove_mean()
     assert "proc_remove_mean" in mixin.__dir__()
-    assert np.mean(mixin.values) == approx(0.0002072868243385)
+    assert np.mean(mixin.values) == approx(0.000248403457910)
 
 
 def test_signal_processing_remove_mean_first_thousand_values(mixin):
     mixin.remove_mean(first_n_samples=1000)
     assert "proc_remove_mean" in mixin.__dir__()
-    assert np.mean(mixin.values) == approx(2.23791399750)
+    assert np.mean(mixin.values) == approx(2.25016878154)
 
 
 @pytest.mark.parametrize("value", [0, 100001])
@@ -40,28 +40,58 @@ def test_signal_processing_remove_value_attribute_naming(mixin):
     assert "proc_remove_value_2_5" in mixin.__dir__()
 
 
+def test_signal_processing_remove_value_numpy_scalar(mixin):
+    mixin.remove_value(np.int64(-2000))
+    assert "proc_remove_value_2000" in mixin.__dir__()
+
+
 def test_signal_processing_remove_value(mixin):
     value = -2000
     mean_before = np.mean(mixin.values)
     mixin.remove_value(value)
     mean_after = np.mean(mixin.values)
     assert "proc_remove_value_2000" in mixin.__dir__()
-    assert int(mean_before - mean_after) == value
+    assert mean_before - mean_after == approx(value)
 
 
-def test_signal_processing_lowpass_with_cutoff(mixin):
+def test_signal_processing_lowpass_with_cutoff(mixin, welch_psd):
     mixin.lowpass(cutoff=5)
     assert "proc_filt_5_lowpass" in mixin.__dir__()
-    freq, power_spectral_density = welch(
-        x=mixin.values,
-        fs=mixin.info.sampling_frequency,
-        nperseg=1024,
-        detrend="linear",
-    )
+    freq, power_spectral_density = welch_psd(mixin)
     mean_low_fq = np.mean(power_spectral_density[freq < 5])
     mean_high_fq = np.mean(power_spectral_density[freq > 5])
-    assert mean_low_fq == approx(0.0001016062190551)
-    assert mean_high_fq == approx(3.5692679e-08)
+    assert mean_low_fq == approx(0.000108239161158)
+    assert mean_high_fq == approx(3.506531565e-08)
+
+
+@pytest.mark.parametrize(
+    "filt_type, cutoff, order",
+    [
+        ("lowpass", 5, 3),
+        ("lowpass", 5, 4),
+        ("highpass", 150, 8),
+        ("bandpass", [50, 100], 4),
+        ("bandstop", [5, 200], 2),
+    ],
+)
+def test_signal_processing_filt_matches_scipy_sosfiltfilt(
+    mixin, filt_type, cutoff, order
+):
+    raw_values = mixin.values.copy()
+    getattr(mixin, filt_type)(cutoff=cutoff, order=order)
+    critical_fq = np.atleast_1d(np.array(cutoff, dtype=float)) / (
+        mixin.info.sampling_frequency / 2
+    )
+    sos = butter(order, critical_fq, filt_type, output="sos")
+    expected = sosfiltfilt(sos, raw_values)
+    assert np.allclose(mixin.values, expected, atol=1e-9)
+
+
+def test_signal_processing_lowpass_preserves_float32(mixin):
+    mixin.values = mixin.values.astype(np.float32)
+    mixin.lowpass(cutoff=5)
+    assert "proc_filt_5_lowpass" in mixin.__dir__()
+    assert mixin.values.dtype == np.float32
 
 
 @pytest.mark.parametrize("cutoff", [0, 1024])
@@ -76,66 +106,46 @@ def test_signal_processing_lowpass_order_out_of_range(mixin, order):
         mixin.lowpass(cutoff=20, order=order)
 
 
-def test_signal_processing_lowpass_with_cutoff_and_order(mixin):
+def test_signal_processing_lowpass_with_cutoff_and_order(mixin, welch_psd):
     mixin.lowpass(cutoff=50, order=2)
     assert "proc_filt_50_lowpass" in mixin.__dir__()
-    freq, power_spectral_density = welch(
-        x=mixin.values,
-        fs=mixin.info.sampling_frequency,
-        nperseg=1024,
-        detrend="linear",
-    )
+    freq, power_spectral_density = welch_psd(mixin)
     mean_low_fq = np.mean(power_spectral_density[freq < 50])
     mean_high_fq = np.mean(power_spectral_density[freq > 50])
-    assert mean_low_fq == approx(0.0001216392998562)
-    assert mean_high_fq == approx(1.00296037e-06)
+    assert mean_low_fq == approx(0.000132469906967)
+    assert mean_high_fq == approx(9.861485784e-07)
 
 
-def test_signal_processing_highpass_with_cutoff(mixin):
+def test_signal_processing_highpass_with_cutoff(mixin, welch_psd):
     mixin.highpass(cutoff=250)
     assert "proc_filt_250_highpass" in mixin.__dir__()
-    freq, power_spectral_density = welch(
-        x=mixin.values,
-        fs=mixin.info.sampling_frequency,
-        nperseg=1024,
-        detrend="linear",
-    )
+    freq, power_spectral_density = welch_psd(mixin)
     mean_low_fq = np.mean(power_spectral_density[freq < 100])
     mean_high_fq = np.mean(power_spectral_density[freq > 100])
-    assert mean_low_fq == approx(6.082511531e-10)
-    assert mean_high_fq == approx(9.58830303178e-05)
+    assert mean_low_fq == approx(3.390891738e-10)
+    assert mean_high_fq == approx(9.459774272e-05)
 
 
-def test_signal_processing_highpass_with_cutoff_and_order(mixin):
+def test_signal_processing_highpass_with_cutoff_and_order(mixin, welch_psd):
     mixin.highpass(cutoff=150, order=8)
     assert "proc_filt_150_highpass" in mixin.__dir__()
-    freq, power_spectral_density = welch(
-        x=mixin.values,
-        fs=mixin.info.sampling_frequency,
-        nperseg=1024,
-        detrend="linear",
-    )
+    freq, power_spectral_density = welch_psd(mixin)
     mean_low_fq = np.mean(power_spectral_density[freq < 100])
     mean_high_fq = np.mean(power_spectral_density[freq > 100])
-    assert mean_low_fq == approx(9.457695299e-10)
-    assert mean_high_fq == approx(0.000141424081)
+    assert mean_low_fq == approx(4.496397434e-10)
+    assert mean_high_fq == approx(0.000139845208226)
 
 
-def test_signal_processing_bandpass_with_cutoff(mixin):
+def test_signal_processing_bandpass_with_cutoff(mixin, welch_psd):
     mixin.bandpass(cutoff=[50, 100])
     assert "proc_filt_50_100_bandpass" in mixin.__dir__()
-    freq, power_spectral_density = welch(
-        x=mixin.values,
-        fs=mixin.info.sampling_frequency,
-        nperseg=1024,
-        detrend="linear",
-    )
-    fq_bandpass_bool = list((freq > 50) & (freq < 100))
-    fq_not_bandpass_bool = [not boolean for boolean in fq_bandpass_bool]
+    freq, power_spectral_density = welch_psd(mixin)
+    fq_bandpass_bool = (freq > 50) & (freq < 100)
+    fq_not_bandpass_bool = ~fq_bandpass_bool
     mean_not_bandpass_fq = np.mean(power_spectral_density[fq_not_bandpass_bool])
     mean_bandpass_fq = np.mean(power_spectral_density[fq_bandpass_bool])
-    assert mean_not_bandpass_fq == approx(4.83518473e-07)
-    assert mean_bandpass_fq == approx(0.00014254199)
+    assert mean_not_bandpass_fq == approx(4.519438809e-07)
+    assert mean_bandpass_fq == approx(0.000145701012)
 
 
 def test_signal_processing_bandpass_cutoff_out_of_range(mixin):
@@ -143,89 +153,74 @@ def test_signal_processing_bandpass_cutoff_out_of_range(mixin):
         mixin.lowpass(cutoff=[5, 1024])
 
 
-def test_signal_processing_bandpass_with_cutoff_and_order(mixin):
+def test_signal_processing_bandpass_with_cutoff_and_order(mixin, welch_psd):
     mixin.bandpass(cutoff=[5, 200], order=2)
     assert "proc_filt_5_200_bandpass" in mixin.__dir__()
-    freq, power_spectral_density = welch(
-        x=mixin.values,
-        fs=mixin.info.sampling_frequency,
-        nperseg=1024,
-        detrend="linear",
-    )
-    fq_bandpass_bool = list((freq > 5) & (freq < 200))
-    fq_not_bandpass_bool = [not boolean for boolean in fq_bandpass_bool]
+    freq, power_spectral_density = welch_psd(mixin)
+    fq_bandpass_bool = (freq > 5) & (freq < 200)
+    fq_not_bandpass_bool = ~fq_bandpass_bool
     mean_not_bandpass_fq = np.mean(power_spectral_density[fq_not_bandpass_bool])
     mean_bandpass_fq = np.mean(power_spectral_density[fq_bandpass_bool])
-    assert mean_not_bandpass_fq == approx(4.02363214e-06)
-    assert mean_bandpass_fq == approx(0.00013225323034)
+    assert mean_not_bandpass_fq == approx(4.091112876e-06)
+    assert mean_bandpass_fq == approx(0.000136365825488)
 
 
-def test_signal_processing_bandstop_with_cutoff(mixin):
+def test_signal_processing_bandstop_with_cutoff(mixin, welch_psd):
     mixin.bandstop(cutoff=[50, 100])
     assert "proc_filt_50_100_bandstop" in mixin.__dir__()
-    freq, power_spectral_density = welch(
-        x=mixin.values,
-        fs=mixin.info.sampling_frequency,
-        nperseg=1024,
-        detrend="linear",
-    )
-    fq_bandstop_bool = list((freq > 50) & (freq < 100))
-    fq_not_bandstop_bool = [not boolean for boolean in fq_bandstop_bool]
+    freq, power_spectral_density = welch_psd(mixin)
+    fq_bandstop_bool = (freq > 50) & (freq < 100)
+    fq_not_bandstop_bool = ~fq_bandstop_bool
     mean_not_bandstop_fq = np.mean(power_spectral_density[fq_not_bandstop_bool])
     mean_bandstop_fq = np.mean(power_spectral_density[fq_bandstop_bool])
-    assert mean_not_bandstop_fq == approx(0.000161772149)
-    assert mean_bandstop_fq == approx(3.7779100806e-06)
+    assert mean_not_bandstop_fq == approx(0.000161996588300)
+    assert mean_bandstop_fq == approx(3.360169828e-06)
 
 
-def test_signal_processing_bandstop_cutoff_and_order(mixin):
+def test_signal_processing_bandstop_cutoff_and_order(mixin, welch_psd):
     mixin.bandstop(cutoff=[5, 200], order=2)
     assert "proc_filt_5_200_bandstop" in mixin.__dir__()
-    freq, power_spectral_density = welch(
-        x=mixin.values,
-        fs=mixin.info.sampling_frequency,
-        nperseg=1024,
-        detrend="linear",
-    )
-    fq_bandstop_bool = list((freq > 5) & (freq < 200))
-    fq_not_bandstop_bool = [not boolean for boolean in fq_bandstop_bool]
+    freq, power_spectral_density = welch_psd(mixin)
+    fq_bandstop_bool = (freq > 5) & (freq < 200)
+    fq_not_bandstop_bool = ~fq_bandstop_bool
     mean_not_bandstop_fq = np.mean(power_spectral_density[fq_not_bandstop_bool])
     mean_bandstop_fq = np.mean(power_spectral_density[fq_bandstop_bool])
-    assert mean_not_bandstop_fq == approx(0.000139964355325)
-    assert mean_bandstop_fq == approx(5.790131269e-06)
+    assert mean_not_bandstop_fq == approx(0.000138240844871)
+    assert mean_bandstop_fq == approx(5.757274897e-06)
 
 
 def test_signal_processing_calibrate_with_slope(mixin):
     mixin.calibrate(slope=10.4)
     assert "proc_calib" in mixin.__dir__()
-    assert int(min(mixin.values)) == 0
-    assert int(max(mixin.values)) == 61
+    assert min(mixin.values) == approx(0.341794128062)
+    assert max(mixin.values) == approx(62.166524620223)
 
 
 def test_signal_processing_calibrate_with_slope_and_offset(mixin):
     mixin.calibrate(slope=10.4, offset=78.3)
-    assert int(min(mixin.values)) == -78
-    assert int(max(mixin.values)) == -16
+    assert min(mixin.values) == approx(-77.958205871937)
+    assert max(mixin.values) == approx(-16.133475379776)
 
 
 def test_signal_processing_norm_percentage(mixin):
     mixin.norm_percentage()
     assert "proc_norm_percentage" in mixin.__dir__()
-    assert int(min(mixin.values)) == 0
-    assert int(max(mixin.values)) == 100
+    assert min(mixin.values) == approx(0.549804143227)
+    assert max(mixin.values) == approx(100.0)
 
 
 def test_signal_processing_norm_proportion(mixin):
     mixin.norm_proportion()
     assert "proc_norm_proportion" in mixin.__dir__()
-    assert int(min(mixin.values)) == 0
-    assert int(max(mixin.values)) == 1
+    assert min(mixin.values) == approx(0.005498041432)
+    assert max(mixin.values) == approx(1.0)
 
 
 def test_signal_processing_norm_percent_value(mixin):
     mixin.norm_percent_value(35)
     assert "proc_norm_value" in mixin.__dir__()
-    assert int(min(mixin.values)) == 0
-    assert int(max(mixin.values)) == 17
+    assert min(mixin.values) == approx(0.093899485731)
+    assert max(mixin.values) == approx(17.078715555006)
 
 
 def test_signal_processing_rect(negative_value_mixin):
@@ -240,7 +235,7 @@ def test_signal_processing_interp_new_times(mixin):
     mixin.interp_new_times(new_times)
     assert "proc_interp_new_times" in mixin.__dir__()
     assert "times_pre_interp" in mixin.__dir__()
-    assert np.mean(mixin.values) == approx(3.00124641)
+    assert np.mean(mixin.values) == approx(3.00324058)
     assert len(mixin.times) == len_new_times
 
 
@@ -248,7 +243,7 @@ def test_signal_processing_interp_new_fs(mixin):
     mixin.interp_new_fs(500)
     assert "proc_interp_new_fs" in mixin.__dir__()
     assert "times_pre_interp" in mixin.__dir__()
-    assert np.mean(mixin.values) == approx(3.000221)
+    assert np.mean(mixin.values) == approx(2.99706149)
     assert len(mixin.times) == 50000
 
 